@@ -0,0 +1,152 @@
+import os
+from typing import Any, Dict, Optional
+
+import orjson
+import redis.asyncio as redis
+
+# The cache is optional: without REDIS_URL (or with Redis unreachable)
+# every call falls through to the database, which stays the source of truth.
+REDIS_URL = os.getenv("REDIS_URL")
+
+_client: Optional[redis.Redis] = redis.from_url(REDIS_URL) if REDIS_URL else None
+
+# Question counts only change through admin edits, which invalidate the
+# key; the TTL is just a backstop against missed invalidations.
+_QCOUNT_TTL_SECONDS = 3600
+
+# Admin listings (questions per group, groups per schedule) are re-read
+# repeatedly while an admin edits an exam; writes invalidate the keys, so
+# the short TTL only bounds staleness across processes.
+_ADMIN_LISTING_TTL_SECONDS = 60
+
+def _payload_key(schedule_id: int) -> str:
+    return f"exam:schedule:{schedule_id}:payload"
+
+def _qcount_key(schedule_id: int) -> str:
+    return f"exam:schedule:{schedule_id}:qcount"
+
+def _group_questions_key(group_id: int) -> str:
+    return f"admin:group:{group_id}:questions"
+
+def _schedule_groups_key(schedule_id: int) -> str:
+    return f"admin:schedule:{schedule_id}:groups"
+
+async def get_exam_payload(schedule_id: int) -> Optional[Dict[str, Any]]:
+    """Returns the cached exam payload for a schedule, or None on a miss."""
+    if _client is None:
+        return None
+    try:
+        raw = await _client.get(_payload_key(schedule_id))
+    except (redis.RedisError, OSError):
+        return None
+    if raw is None:
+        return None
+    return orjson.loads(raw)
+
+async def set_exam_payload(schedule_id: int, payload: Dict[str, Any], ttl_seconds: int) -> None:
+    """Caches the exam payload until the end of the exam window."""
+    if _client is None or ttl_seconds <= 0:
+        return
+    try:
+        await _client.setex(_payload_key(schedule_id), ttl_seconds, orjson.dumps(payload))
+    except (redis.RedisError, OSError):
+        pass
+
+async def get_question_count(schedule_id: int) -> Optional[int]:
+    """Returns the cached question count for a schedule, or None on a miss."""
+    if _client is None:
+        return None
+    try:
+        raw = await _client.get(_qcount_key(schedule_id))
+    except (redis.RedisError, OSError):
+        return None
+    if raw is None:
+        return None
+    return int(raw)
+
+async def set_question_count(schedule_id: int, count: int) -> None:
+    """Caches the question count for a schedule."""
+    if _client is None:
+        return
+    try:
+        await _client.setex(_qcount_key(schedule_id), _QCOUNT_TTL_SECONDS, count)
+    except (redis.RedisError, OSError):
+        pass
+
+async def invalidate_question_count(schedule_id: int) -> None:
+    """Drops the cached question count after questions are added or removed."""
+    if _client is None:
+        return
+    try:
+        await _client.delete(_qcount_key(schedule_id))
+    except (redis.RedisError, OSError):
+        pass
+
+async def get_group_questions(group_id: int) -> Optional[list]:
+    """Returns the cached admin question listing for a group, or None on a miss."""
+    if _client is None:
+        return None
+    try:
+        raw = await _client.get(_group_questions_key(group_id))
+    except (redis.RedisError, OSError):
+        return None
+    if raw is None:
+        return None
+    return orjson.loads(raw)
+
+async def set_group_questions(group_id: int, listing: list) -> None:
+    """Caches the admin question listing for a group."""
+    if _client is None:
+        return
+    try:
+        await _client.setex(_group_questions_key(group_id), _ADMIN_LISTING_TTL_SECONDS, orjson.dumps(listing))
+    except (redis.RedisError, OSError):
+        pass
+
+async def invalidate_group_questions(group_id: int) -> None:
+    """Drops the cached question listing after a question in the group changes."""
+    if _client is None:
+        return
+    try:
+        await _client.delete(_group_questions_key(group_id))
+    except (redis.RedisError, OSError):
+        pass
+
+async def get_schedule_groups(schedule_id: int) -> Optional[list]:
+    """Returns the cached admin group listing for a schedule, or None on a miss."""
+    if _client is None:
+        return None
+    try:
+        raw = await _client.get(_schedule_groups_key(schedule_id))
+    except (redis.RedisError, OSError):
+        return None
+    if raw is None:
+        return None
+    return orjson.loads(raw)
+
+async def set_schedule_groups(schedule_id: int, listing: list) -> None:
+    """Caches the admin group listing for a schedule."""
+    if _client is None:
+        return
+    try:
+        await _client.setex(_schedule_groups_key(schedule_id), _ADMIN_LISTING_TTL_SECONDS, orjson.dumps(listing))
+    except (redis.RedisError, OSError):
+        pass
+
+async def invalidate_schedule_groups(schedule_id: int) -> None:
+    """Drops the cached group listing after a group or its questions change."""
+    if _client is None:
+        return
+    try:
+        await _client.delete(_schedule_groups_key(schedule_id))
+    except (redis.RedisError, OSError):
+        pass
+
+async def invalidate_exam_payload(schedule_id: int) -> None:
+    """Drops the cached payload after a schedule is changed or deleted."""
+    if _client is None:
+        return
+    try:
+        await _client.delete(_payload_key(schedule_id))
+    except (redis.RedisError, OSError):
+        pass
@@ -1,62 +1,151 @@
 import os
-from jose import jwt, JWTError
+import base64
+import hashlib
+import hmac
+import threading
+import time
+import orjson
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
+import jwt
+from jwt import PyJWTError
 from typing import Dict, Any
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
-from datetime import datetime, timedelta
+from datetime import timedelta
+from types import MappingProxyType
 from schema import schemas
 from typing import Optional
 
 SECRET_KEY = os.getenv("SECRET_KEY", "-dt8lK9P8ULpvQQ-GDm5EQoUSkbF-CabowHCUUepbGMGGs8p6kZIUEljfS_57M13IZVjz0jG8H9-Y4GwuWT7Xw")
 ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 60 
+ACCESS_TOKEN_EXPIRE_MINUTES = 60
+ACCESS_TOKEN_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/exam-login")
 
+# Built once; raising a shared instance avoids re-allocating the exception
+# and its headers dict on every auth failure (and on every call when it
+# was constructed ahead of the try block).
+_CREDENTIALS_EXCEPTION = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+# The same token is presented on every request for the whole exam session,
+# so cache decoded tokens for the token lifetime to skip the HMAC + JSON
+# work on repeats; each hit still checks the stored exp, so a cached
+# entry can never outlive its token.
+_token_cache = TTLCache(maxsize=10000, ttl=ACCESS_TOKEN_EXPIRE_SECONDS)
+_token_cache_lock = threading.Lock()
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+# Exam passwords are shared per schedule, so when a whole class logs in at
+# once only the first verification pays the argon2 cost; subsequent logins
+# hit the cache, keyed by a keyed BLAKE2b digest of the submitted password.
+_pwd_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
+_verified_passwords = TTLCache(maxsize=1024, ttl=300)
+_verified_passwords_lock = threading.Lock()
+
+def hash_exam_password(password: str) -> str:
+    """Hashes an exam password for storage on the schedule."""
+    return _pwd_hasher.hash(password)
+
+def verify_exam_password(schedule_id: int, stored_hash: str, password: str) -> bool:
+    """Verifies a submitted exam password against a schedule's stored hash."""
+    key = (schedule_id, hashlib.blake2b(password.encode(), key=SECRET_KEY.encode()[:32]).digest())
+
+    with _verified_passwords_lock:
+        if key in _verified_passwords:
+            return True
+
+    try:
+        _pwd_hasher.verify(stored_hash, password)
+    except (VerificationError, InvalidHashError):
+        # InvalidHashError: the stored value is not an argon2 hash (e.g. a
+        # legacy plaintext row) — treat as a mismatch, not a server error.
+        return False
+
+    with _verified_passwords_lock:
+        _verified_passwords[key] = True
+
+    return True
+
+# The header never changes for HS256, so serialize it once; likewise keep
+# the key as bytes so each encode is just orjson + base64 + one HMAC.
+_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+_KEY_BYTES = SECRET_KEY.encode()
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """Generates a JWT token containing student and schedule IDs."""
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    to_encode["exp"] = int(time.time()) + (
+        int(expires_delta.total_seconds()) if expires_delta else ACCESS_TOKEN_EXPIRE_SECONDS
+    )
+    payload_b64 = base64.urlsafe_b64encode(orjson.dumps(to_encode)).rstrip(b"=")
+    signing_input = _HEADER_B64 + b"." + payload_b64
+    signature_b64 = base64.urlsafe_b64encode(
+        hmac.new(_KEY_BYTES, signing_input, hashlib.sha256).digest()
+    ).rstrip(b"=")
+    return (signing_input + b"." + signature_b64).decode()
 
 async def get_current_active_student(token: str = Depends(oauth2_scheme)) -> schemas.TokenData:
     """
     Decodes the JWT token, validates its signature and expiration, 
     and returns the student/class information.
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
+    cache_key = _token_cache_key(token)
+
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_key)
+
+    if cached is not None:
+        token_data, token_exp = cached
+        if time.time() > token_exp:
+            with _token_cache_lock:
+                _token_cache.pop(cache_key, None)
+        else:
+            return token_data
+
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        
-        student_id: int = payload.get("student_id")
-        class_id: int = payload.get("class_id")
-        
-        if student_id is None or class_id is None:
-            raise credentials_exception
-            
+        # Cache misses pay the HMAC/JSON cost off-loop so concurrent
+        # requests are not serialized behind the decode. Required claims
+        # are enforced by the decoder itself in the same pass.
+        payload = await run_in_threadpool(
+            jwt.decode,
+            token,
+            SECRET_KEY,
+            [ALGORITHM],
+            options={"require": ["exp", "sub", "student_id", "class_id", "schedule_id"]},
+        )
+
         token_data = schemas.TokenData(
-            student_id=student_id, 
-            class_id=class_id, 
-            sub=payload.get("sub"),
-            schedule_id=payload.get("schedule_id")
+            student_id=payload["student_id"],
+            class_id=payload["class_id"],
+            sub=payload["sub"],
+            schedule_id=payload["schedule_id"]
         )
-        
-    except JWTError:
-        raise credentials_exception
-        
+
+    except PyJWTError:
+        raise _CREDENTIALS_EXCEPTION
+
+    with _token_cache_lock:
+        _token_cache[cache_key] = (token_data, payload["exp"])
+
     return token_data
 
+# Placeholder until real admin auth lands; frozen so the per-request
+# dependency doesn't allocate a new dict, and immutable so handlers can't
+# accidentally mutate shared state. Real admin tokens should reuse
+# _token_cache keyed by (token_hash, "admin").
+_ADMIN_STUB = MappingProxyType({"user_id": 1, "role": "admin"})
+
 async def get_current_admin_user():
-    return {"user_id": 1, "role": "admin"}
+    return _ADMIN_STUB
 
 
 
@@ -1,19 +1,29 @@
+import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from routes.route import exam_router, admin_router
 from config.database import SessionLocal, engine
 import uvicorn
 from models import models
 
-models.Base.metadata.create_all(bind=engine)
-
 
 app = FastAPI(
     title="ChronosAssessment: Scheduled CBT Platform API",
     description="Backend API for secure, time-bound, class-specific computer-based testing.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
+@app.on_event("startup")
+async def create_tables():
+    # Opt-in so that multi-worker deployments don't all race through DDL
+    # catalog lookups on boot; set DB_CREATE_TABLES=1 for fresh databases.
+    if os.getenv("DB_CREATE_TABLES", "0") == "1":
+        async with engine.begin() as conn:
+            await conn.run_sync(models.Base.metadata.create_all)
+
 origins = [
     "http://localhost",
     "http://localhost:5500",
@@ -22,6 +32,10 @@ origins = [
     "*",
 ]
 
+# Exam papers are text-heavy JSON that compresses well; the size floor
+# keeps small responses from paying compression CPU for nothing.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -1,5 +1,7 @@
-from sqlalchemy import Boolean, Column, Integer, String, ForeignKey, DateTime, Date, Time
+from sqlalchemy import Boolean, Column, Integer, String, ForeignKey, DateTime, Date, Time, Index
 from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
 from config.database import Base
 from datetime import datetime, date, time
 from typing import Optional, List
@@ -13,6 +15,9 @@ class Class(Base):
 
 class Student(Base):
     __tablename__ = "students"
+    # Covering index keeps the login lookup index-only: the columns the
+    # auth query reads ride along without a heap fetch.
+    __table_args__ = (Index("ix_students_reg_covering", "reg_number", postgresql_include=["id", "class_id", "full_name"]),)
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
     full_name: Mapped[str] = Column(String, index=True, nullable=False)
     reg_number: Mapped[str] = Column(String, unique=True, index=True, nullable=False)
@@ -22,6 +27,9 @@ class Student(Base):
 
 class ExamSchedule(Base):
     __tablename__ = "exam_schedules"
+    # Login fetches the candidate schedules for (class, date) before the
+    # argon2 check, so that predicate gets the composite index.
+    __table_args__ = (Index("ix_sched_login", "class_id", "exam_date"),)
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
     subject_id: Mapped[int] = Column(Integer, ForeignKey("subjects.id"), nullable=False)
     class_id: Mapped[int] = Column(Integer, ForeignKey("classes.id"), nullable=False)
@@ -36,68 +44,81 @@ class ExamSchedule(Base):
 
 class ScheduledAttempt(Base):
     __tablename__ = "scheduled_attempts"
+    __table_args__ = (Index("ix_sched_attempt_student_schedule", "student_id", "schedule_id", unique=True),)
     id: Mapped[int] = Column(Integer, primary_key=True, index=True) 
     student_id: Mapped[int] = Column(Integer, ForeignKey("students.id"), nullable=False) 
     schedule_id: Mapped[int] = Column(Integer, ForeignKey("exam_schedules.id"), nullable=False)
-    start_time: Mapped[datetime] = Column(DateTime, default=datetime.utcnow)
+    start_time: Mapped[datetime] = Column(DateTime, server_default=func.now())
     end_time: Mapped[Optional[datetime]] = Column(DateTime, nullable=True)
-    score: Mapped[int] = Column(Integer, default=0) 
+    score: Mapped[int] = Column(Integer, default=0)
+    answered_count: Mapped[int] = Column(Integer, default=0)
     student: Mapped['Student'] = relationship("Student", back_populates="attempts")
     schedule: Mapped['ExamSchedule'] = relationship("ExamSchedule", back_populates="attempts")
+    # No eager loading: the collection grows with every answered question,
+    # and the hot paths (submit/finish/report) work from the counter
+    # columns, never this collection.
     answers: Mapped[List['UserAnswer']] = relationship("UserAnswer", back_populates="attempt", cascade="all, delete-orphan")
     final_report: Mapped['FinalReport'] = relationship("FinalReport", back_populates="attempt", uselist=False)
 
 class UserAnswer(Base):
     __tablename__ = "user_answers"
+    __table_args__ = (Index("uq_user_answers_attempt_question", "attempt_id", "question_id", unique=True),)
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
     attempt_id: Mapped[int] = Column(Integer, ForeignKey("scheduled_attempts.id"))
     question_id: Mapped[int] = Column(Integer, ForeignKey("questions.id"))
     selected_option_id: Mapped[int] = Column(Integer, ForeignKey("options.id"))
     is_correct: Mapped[bool] = Column(Boolean, default=False)
     correct_option_id: Mapped[int] = Column(Integer, ForeignKey("options.id"))
-    answered_at: Mapped[datetime] = Column(DateTime, default=datetime.utcnow)
+    answered_at: Mapped[datetime] = Column(DateTime, server_default=func.now())
     attempt: Mapped['ScheduledAttempt'] = relationship("ScheduledAttempt", back_populates="answers")
 
 class FinalReport(Base):
     __tablename__ = "final_reports"
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
     attempt_id: Mapped[int] = Column(Integer, ForeignKey("scheduled_attempts.id"), unique=True, nullable=False)
-    subject_scores_json: Mapped[str] = Column(String, nullable=False)
+    subject_scores_json: Mapped[dict] = Column(JSONB, nullable=False)
     final_score: Mapped[int] = Column(Integer, nullable=False)
+    total_questions: Mapped[int] = Column(Integer, nullable=False)
     time_taken_seconds: Mapped[int] = Column(Integer, nullable=False)
     attempt: Mapped['ScheduledAttempt'] = relationship("ScheduledAttempt", back_populates="final_report")
 
 class Option(Base):
     __tablename__ = "options"
+    __table_args__ = (Index("ix_options_question", "question_id"),)
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
     option_text: Mapped[str] = Column(String, nullable=False)
-    question_id: Mapped[int] = Column(Integer, ForeignKey("questions.id"))
+    question_id: Mapped[int] = Column(Integer, ForeignKey("questions.id", ondelete="CASCADE"))
     question: Mapped['Question'] = relationship("Question", back_populates="options", foreign_keys=[question_id])
 
 class Question(Base):
     __tablename__ = "questions"
+    __table_args__ = (Index("ix_questions_group_number", "group_id", "question_number"),)
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
     question_text: Mapped[str] = Column(String, nullable=False)
-    correct_option_id: Mapped[int] = Column(Integer, ForeignKey("options.id"))
+    # SET NULL lets a question's options be deleted without first nulling
+    # the pointer by hand; CASCADE lets group/question deletes be a single
+    # DELETE statement instead of ORM-cascaded row-by-row deletes.
+    correct_option_id: Mapped[int] = Column(Integer, ForeignKey("options.id", ondelete="SET NULL"))
     question_number: Mapped[int] = Column(Integer, nullable=False)
-    group_id: Mapped[int] = Column(ForeignKey("question_groups.id"), nullable=False)
+    group_id: Mapped[int] = Column(ForeignKey("question_groups.id", ondelete="CASCADE"), nullable=False)
     group: Mapped["QuestionGroup"] = relationship("QuestionGroup", back_populates="questions")
     correct_option: Mapped['Option'] = relationship("Option", foreign_keys=[correct_option_id])
-    options: Mapped[List[Option]] = relationship("Option", back_populates="question", foreign_keys=[Option.question_id], cascade="all, delete-orphan")
+    options: Mapped[List[Option]] = relationship("Option", back_populates="question", foreign_keys=[Option.question_id], lazy="selectin", cascade="all, delete-orphan")
 
 class QuestionGroup(Base):
     __tablename__ = "question_groups"
+    __table_args__ = (Index("ix_qgroup_schedule_order", "schedule_id", "display_order", unique=True),)
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
     schedule_id: Mapped[int] = Column(ForeignKey("exam_schedules.id"), nullable=False)
     instruction_text: Mapped[str] = Column(String, nullable=False)
     group_title: Mapped[Optional[str]] = Column(String, nullable=True) 
     display_order: Mapped[int] = Column(Integer, nullable=False) 
     schedule: Mapped["ExamSchedule"] = relationship("ExamSchedule", back_populates="question_groups")
-    questions: Mapped[List["Question"]] = relationship("Question", back_populates="group", cascade="all, delete-orphan")
+    questions: Mapped[List["Question"]] = relationship("Question", back_populates="group", lazy="selectin", cascade="all, delete-orphan")
 
 class Subject(Base):
     __tablename__ = "subjects"
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
-    name: Mapped[str] = Column(String, nullable=False)
+    name: Mapped[str] = Column(String, unique=True, nullable=False)
     schedules: Mapped[List["ExamSchedule"]] = relationship(back_populates="subject")
     
@@ -1,38 +1,160 @@
-import json 
-from datetime import datetime, date, timedelta
+import os
+from datetime import datetime, date, time, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, case
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload, noload, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import func, select, insert, delete, update, and_, literal
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from models import models
 from schema import schemas
+from cache import exam_cache
 from config.database import get_db
+from fastapi.concurrency import run_in_threadpool
 from config.auth import get_current_active_student, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
-from config.auth import get_current_admin_user
+from config.auth import get_current_admin_user, hash_exam_password, verify_exam_password
 
 exam_router = APIRouter()
 admin_router = APIRouter(prefix="/admin")
 
+# With DB_STRICT_LOADING=1 (dev/staging), hot-path queries whitelist the
+# relationships they need and any other access raises instead of silently
+# issuing another SELECT, so N+1 regressions fail loudly before prod.
+_STRICT_LOADING = os.getenv("DB_STRICT_LOADING", "0") == "1"
+
+def _guarded(*loaders):
+    return (*loaders, raiseload("*")) if _STRICT_LOADING else loaders
+
+def _integrity_conflict(exc: IntegrityError, conflict_detail: str, missing_detail: Optional[str] = None) -> HTTPException:
+    """Maps a constraint violation raised at commit to 409 (unique) or 404 (missing FK target)."""
+    orig = exc.orig
+    code = (
+        getattr(orig, "sqlstate", None)
+        or getattr(orig, "pgcode", None)
+        or getattr(getattr(orig, "__cause__", None), "sqlstate", None)
+    )
+    if missing_detail is not None and code == "23503":
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=missing_detail)
+    return HTTPException(status_code=status.HTTP_409_CONFLICT, detail=conflict_detail)
+
+async def _exists(db: AsyncSession, model, *criteria) -> bool:
+    """Checks row existence with SELECT 1, without hydrating an ORM instance."""
+    return await db.scalar(
+        select(literal(True)).select_from(model).where(*criteria).limit(1)
+    ) is not None
+
+def _correct_option_index(options) -> int:
+    """Validates exactly one option is marked correct; returns its index.
+
+    Single pass, bailing out as soon as a second correct option shows up,
+    instead of materializing a filtered list just to len() it.
+    """
+    correct_index = -1
+    for index, option_data in enumerate(options):
+        if option_data.is_correct:
+            if correct_index != -1:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Exactly one option must be marked as correct.")
+            correct_index = index
+    if correct_index == -1:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Exactly one option must be marked as correct.")
+    return correct_index
+
+def _schedule_listing_query():
+    """Builds the column-projected schedules listing with joined names."""
+    return (
+        select(
+            models.ExamSchedule.id,
+            models.ExamSchedule.subject_id,
+            models.ExamSchedule.class_id,
+            models.ExamSchedule.exam_date,
+            models.ExamSchedule.start_time,
+            models.ExamSchedule.duration_minutes,
+            models.ExamSchedule.exam_password,
+            models.Subject.name.label("subject_name"),
+            models.Class.name.label("class_name"),
+        )
+        .join(models.Subject, models.ExamSchedule.subject_id == models.Subject.id)
+        .join(models.Class, models.ExamSchedule.class_id == models.Class.id)
+    )
+
+def _student_display_from_row(row) -> schemas.StudentDisplay:
+    return schemas.StudentDisplay(
+        id=row.id,
+        full_name=row.full_name,
+        reg_number=row.reg_number,
+        class_id=row.class_id,
+        class_name=row.class_name,
+        student_class=(
+            schemas.ClassDisplay(id=row.class_id, name=row.class_name)
+            if row.class_name is not None else None
+        ),
+    )
+
+def _schedule_display_from_row(row) -> schemas.ExamScheduleDisplay:
+    return schemas.ExamScheduleDisplay(
+        id=row.id,
+        subject_id=row.subject_id,
+        class_id=row.class_id,
+        exam_date=row.exam_date,
+        start_time=row.start_time,
+        duration_minutes=row.duration_minutes,
+        exam_password=row.exam_password,
+        subject=schemas.SubjectDisplay(id=row.subject_id, name=row.subject_name),
+        exam_class=schemas.ClassDisplay(id=row.class_id, name=row.class_name),
+    )
+
+async def _total_questions_for(db: AsyncSession, schedule_id: int) -> int:
+    """Returns the question count for a schedule, served from cache when warm."""
+    cached = await exam_cache.get_question_count(schedule_id)
+    if cached is not None:
+        return cached
+
+    total = await db.scalar(
+        select(func.count()).select_from(models.Question).join(
+            models.QuestionGroup, models.Question.group_id == models.QuestionGroup.id
+        ).where(models.QuestionGroup.schedule_id == schedule_id)
+    )
+    await exam_cache.set_question_count(schedule_id, total)
+    return total
+
 
 # ============= AUTH ============
 # Login route
 @exam_router.post("/auth/exam-login", response_model=schemas.ExamAuthToken)
-async def exam_login(login_data: schemas.ExamLoginInput, db: Session = Depends(get_db)):
-    student_model = db.query(models.Student).filter(models.Student.reg_number == login_data.reg_number).first()
-    
-    if not student_model:
+async def exam_login(login_data: schemas.ExamLoginInput, db: AsyncSession = Depends(get_db)):
+    current_date = date.today()
+
+    # One round-trip: the student joined (outer, so a valid student with no
+    # exam today still rows back) to that class's candidate schedules.
+    rows = (await db.execute(
+        select(models.Student, models.ExamSchedule)
+        .outerjoin(models.ExamSchedule, and_(
+            models.ExamSchedule.class_id == models.Student.class_id,
+            models.ExamSchedule.exam_date == current_date
+        ))
+        .where(models.Student.reg_number == login_data.reg_number)
+    )).all()
+
+    if not rows:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid Registration Number or Exam Password."
         )
-    current_date = date.today()
-    current_time = datetime.now().time()
 
-    schedule_model = db.query(models.ExamSchedule).filter(
-        models.ExamSchedule.exam_password == login_data.exam_password,
-        models.ExamSchedule.exam_date == current_date,
-        models.ExamSchedule.class_id == student_model.class_id
-    ).first()
+    student_model = rows[0][0]
+
+    schedule_model = None
+    for _, candidate in rows:
+        if candidate is None:
+            continue
+        # argon2 verification is CPU-bound, so keep it off the event loop;
+        # repeat logins for the same schedule hit the verification cache.
+        if await run_in_threadpool(verify_exam_password, candidate.id, candidate.exam_password, login_data.exam_password):
+            schedule_model = candidate
+            break
 
     if not schedule_model:
         raise HTTPException(
@@ -49,7 +171,7 @@ async def exam_login(login_data: schemas.ExamLoginInput, db: Session = Depends(g
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"This exam has not yet started. Scheduled start time is {schedule_model.start_time.strftime('%I:%M %p')}."
         )
-    
+
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     token_data = {
         "sub": student_model.reg_number,
@@ -57,7 +179,7 @@ async def exam_login(login_data: schemas.ExamLoginInput, db: Session = Depends(g
         "class_id": student_model.class_id,
         "schedule_id": schedule_model.id
     }
-    
+
     access_token = create_access_token(data=token_data, expires_delta=access_token_expires)
 
     return schemas.ExamAuthToken(access_token=access_token)
@@ -66,54 +188,107 @@ async def exam_login(login_data: schemas.ExamLoginInput, db: Session = Depends(g
 # ============= EXAM SESSION ============
 # Start exam session
 @exam_router.post("/exam/start/{schedule_id}", response_model=schemas.ExamStartResponse)
-async def start_exam_session(schedule_id: int, current_user_data: schemas.TokenData = Depends(get_current_active_student), db: Session = Depends(get_db)):
-    
+async def start_exam_session(schedule_id: int, current_user_data: schemas.TokenData = Depends(get_current_active_student), db: AsyncSession = Depends(get_db)):
+
     student_id = current_user_data.student_id
     current_class_id = current_user_data.class_id
-    
-    exam_schedule = db.query(models.ExamSchedule).options(
-        joinedload(models.ExamSchedule.subject),
-        joinedload(models.ExamSchedule.question_groups)
-        .joinedload(models.QuestionGroup.questions)
-        .joinedload(models.Question.options)
-    ).filter(
-        models.ExamSchedule.id == schedule_id
-    ).first()
-    
-    if not exam_schedule:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exam Schedule not found.")
-    
-    if exam_schedule.class_id != current_class_id:
+
+    # Hundreds of students start the same schedule within one exam window,
+    # so after the first start the nested paper load is served from cache.
+    exam_payload = await exam_cache.get_exam_payload(schedule_id)
+    payload_from_db = exam_payload is None
+
+    if payload_from_db:
+        # subject is many-to-one (joinedload stays cheap); the collections
+        # use selectinload so the DB sends one IN query per level instead
+        # of a groups x questions x options product. load_only narrows each
+        # level to the payload columns — notably correct_option_id never
+        # leaves the database on this path.
+        exam_schedule = (await db.scalars(
+            select(models.ExamSchedule).options(
+                joinedload(models.ExamSchedule.subject),
+                selectinload(models.ExamSchedule.question_groups)
+                .selectinload(models.QuestionGroup.questions)
+                .load_only(
+                    models.Question.id,
+                    models.Question.group_id,
+                    models.Question.question_number,
+                    models.Question.question_text,
+                )
+                .selectinload(models.Question.options)
+                .load_only(models.Option.id, models.Option.option_text)
+            ).where(
+                models.ExamSchedule.id == schedule_id
+            )
+        )).first()
+
+        if not exam_schedule:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exam Schedule not found.")
+
+        exam_payload = {
+            "class_id": exam_schedule.class_id,
+            "exam_date": exam_schedule.exam_date.isoformat(),
+            "start_time": exam_schedule.start_time.isoformat(),
+            "duration_minutes": exam_schedule.duration_minutes,
+            "subject_name": exam_schedule.subject.name,
+            "total_questions": sum(len(group.questions) for group in exam_schedule.question_groups),
+            "question_groups": [
+                {
+                    "id": group.id,
+                    "instruction_text": group.instruction_text,
+                    "group_title": group.group_title,
+                    "display_order": group.display_order,
+                    "questions": [
+                        {
+                            "id": question.id,
+                            "group_id": question.group_id,
+                            "question_number": question.question_number,
+                            "question_text": question.question_text,
+                            "options": [
+                                {"id": option.id, "option_text": option.option_text}
+                                for option in question.options
+                            ],
+                        }
+                        for question in group.questions
+                    ],
+                }
+                for group in exam_schedule.question_groups
+            ],
+        }
+
+    if exam_payload["class_id"] != current_class_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied. This exam is not scheduled for your class.")
 
-    existing_attempt = db.query(models.ScheduledAttempt).filter(
-        models.ScheduledAttempt.student_id == student_id,
-        models.ScheduledAttempt.schedule_id == schedule_id
-    ).first()
-    
+    existing_attempt = (await db.scalars(
+        select(models.ScheduledAttempt).where(
+            models.ScheduledAttempt.student_id == student_id,
+            models.ScheduledAttempt.schedule_id == schedule_id
+        )
+    )).first()
+
     if existing_attempt:
         if existing_attempt.end_time is None:
-            new_attempt = existing_attempt 
+            new_attempt = existing_attempt
         else:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="This exam has already been completed and submitted.")
     else:
         new_attempt = models.ScheduledAttempt(
             student_id=student_id,
             schedule_id=schedule_id,
-            start_time=datetime.now(),
             score=0
         )
         db.add(new_attempt)
-        db.commit()
-        db.refresh(new_attempt)
+        await db.commit()
+        await db.refresh(new_attempt)
 
     today = date.today()
     now_dt = datetime.combine(today, datetime.now().time())
-    
-    schedule_start_dt = datetime.combine(exam_schedule.exam_date, exam_schedule.start_time)
-    schedule_end_dt = schedule_start_dt + timedelta(minutes=exam_schedule.duration_minutes)
 
-    if exam_schedule.exam_date != today:
+    exam_date = date.fromisoformat(exam_payload["exam_date"])
+    schedule_start_dt = datetime.combine(exam_date, time.fromisoformat(exam_payload["start_time"]))
+    schedule_end_dt = schedule_start_dt + timedelta(minutes=exam_payload["duration_minutes"])
+
+    if exam_date != today:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="This exam is not scheduled for today.")
 
     if not (schedule_start_dt <= now_dt <= schedule_end_dt):
@@ -122,93 +297,141 @@ async def start_exam_session(schedule_id: int, current_user_data: schemas.TokenD
         else:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="The exam period has elapsed. It is now closed.")
 
-    total_questions = sum(
-        len(group.questions) for group in exam_schedule.question_groups
-    )
-    
+    total_questions = exam_payload["total_questions"]
+
     if total_questions == 0:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No questions found for this exam schedule.")
 
+    if payload_from_db:
+        await exam_cache.set_exam_payload(
+            schedule_id, exam_payload, int((schedule_end_dt - now_dt).total_seconds())
+        )
+
     response_data = {
         "attempt_id": new_attempt.id,
         "schedule_id": schedule_id,
-        "subject_name": exam_schedule.subject.name, 
-        "duration_minutes": exam_schedule.duration_minutes,
-        "question_groups": exam_schedule.question_groups,
+        "subject_name": exam_payload["subject_name"],
+        "duration_minutes": exam_payload["duration_minutes"],
+        "question_groups": exam_payload["question_groups"],
         "total_questions": total_questions
     }
 
+    # A cached payload already passed response validation when it was first
+    # built, so on hits skip Pydantic and hand the dict straight to orjson.
+    if not payload_from_db:
+        return ORJSONResponse(response_data)
+
     return schemas.ExamStartResponse.model_validate(response_data)
 
 # Submit answer route
 @exam_router.post("/exam/attempt/{attempt_id}/answers", response_model=schemas.AnswerValidationResponse)
-async def submit_answer(attempt_id: int, submission: schemas.AnswerInput, current_user_data: schemas.TokenData = Depends(get_current_active_student), db: Session = Depends(get_db)):
+async def submit_answer(attempt_id: int, submission: schemas.AnswerInput, current_user_data: schemas.TokenData = Depends(get_current_active_student), db: AsyncSession = Depends(get_db)):
     student_id = current_user_data.student_id
 
-    attempt_model = db.query(models.ScheduledAttempt).filter(
-        models.ScheduledAttempt.id == attempt_id,
-        models.ScheduledAttempt.student_id == student_id
-    ).first()
-    
-    if not attempt_model:
+    # Lock the attempt row before reading anything else: concurrent
+    # submissions for the same attempt serialize here, so the read below
+    # (a fresh statement, hence a fresh snapshot under READ COMMITTED)
+    # always sees the latest committed answer row and the counter deltas
+    # computed from it cannot double-count two parallel clicks.
+    locked_attempt_id = await db.scalar(
+        select(models.ScheduledAttempt.id)
+        .where(
+            models.ScheduledAttempt.id == attempt_id,
+            models.ScheduledAttempt.student_id == student_id,
+        )
+        .with_for_update()
+    )
+
+    if locked_attempt_id is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exam Attempt not found or access denied.")
-    
-    schedule_model = attempt_model.schedule
+
+    # One round-trip fetches the attempt, the question (validated against
+    # the attempt's schedule through its group) and any previous answer.
+    row = (await db.execute(
+        select(models.ScheduledAttempt, models.Question, models.UserAnswer)
+        .select_from(models.ScheduledAttempt)
+        .outerjoin(models.Question, and_(
+            models.Question.id == submission.question_id,
+            models.Question.group_id.in_(
+                select(models.QuestionGroup.id).where(
+                    models.QuestionGroup.schedule_id == models.ScheduledAttempt.schedule_id
+                )
+            )
+        ))
+        .outerjoin(models.UserAnswer, and_(
+            models.UserAnswer.attempt_id == models.ScheduledAttempt.id,
+            models.UserAnswer.question_id == submission.question_id
+        ))
+        # noload: the question's options collection would otherwise eager-
+        # load here, and only correct_option_id is read.
+        .options(*_guarded(joinedload(models.ScheduledAttempt.schedule)), noload(models.Question.options))
+        .where(
+            models.ScheduledAttempt.id == attempt_id,
+            models.ScheduledAttempt.student_id == student_id
+        )
+    )).first()
+
+    if not row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exam Attempt not found or access denied.")
+
+    attempt_model, question_model, existing_answer = row
+
     schedule_model = attempt_model.schedule
-    
+
     if attempt_model.end_time:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="This exam has already concluded and cannot accept more answers.")
-    
+
     scheduled_end_dt = attempt_model.start_time + timedelta(minutes=schedule_model.duration_minutes)
     now_utc = datetime.now()
-    
+
     if now_utc > scheduled_end_dt:
         attempt_model.end_time = now_utc
-        db.commit()
-        
+        await db.commit()
+
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Time limit reached. Exam has been auto-submitted. Answer not recorded.")
 
-    question_model = db.query(models.Question).filter(
-        models.Question.id == submission.question_id,
-        models.Question.schedule_id == schedule_model.id
-    ).first()
-    
     if not question_model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question not found or does not belong to this exam.")
 
     is_correct = (submission.selected_option_id == question_model.correct_option_id)
 
-    existing_answer = db.query(models.UserAnswer).filter(
-        models.UserAnswer.attempt_id == attempt_id,
-        models.UserAnswer.question_id == submission.question_id
-    ).first()
-
-    if existing_answer:
-        if existing_answer.is_correct:
-            attempt_model.score -= 1
-            
-        existing_answer.selected_option_id = submission.selected_option_id
-        existing_answer.is_correct = is_correct
-        existing_answer.answered_at = now_utc
-        
-        db.add(existing_answer)
-        
-    else:
-        new_user_answer = models.UserAnswer(
+    # A single upsert guarded by the (attempt_id, question_id) unique
+    # index, plus a relative score UPDATE applied server-side. The deltas
+    # come from existing_answer, which is safe because the attempt-row
+    # lock above serializes submissions for this attempt.
+    await db.execute(
+        pg_insert(models.UserAnswer)
+        .values(
             attempt_id=attempt_id,
             question_id=submission.question_id,
             selected_option_id=submission.selected_option_id,
             is_correct=is_correct,
             correct_option_id=question_model.correct_option_id,
-            answered_at=now_utc
         )
-        db.add(new_user_answer)
-    
-    if is_correct:
-        attempt_model.score += 1
+        .on_conflict_do_update(
+            index_elements=[models.UserAnswer.attempt_id, models.UserAnswer.question_id],
+            set_={
+                "selected_option_id": submission.selected_option_id,
+                "is_correct": is_correct,
+                "answered_at": now_utc,
+            },
+        )
+    )
+
+    score_delta = int(is_correct) - int(existing_answer.is_correct if existing_answer else False)
+    answered_delta = 0 if existing_answer else 1
+    if score_delta or answered_delta:
+        await db.execute(
+            update(models.ScheduledAttempt)
+            .where(models.ScheduledAttempt.id == attempt_id)
+            .values(
+                score=models.ScheduledAttempt.score + score_delta,
+                answered_count=models.ScheduledAttempt.answered_count + answered_delta,
+            )
+        )
+
+    await db.commit()
 
-    db.commit()
-    
     return schemas.AnswerValidationResponse(
         is_correct=is_correct,
         correct_option_id=question_model.correct_option_id,
@@ -217,18 +440,22 @@ async def submit_answer(attempt_id: int, submission: schemas.AnswerInput, curren
 
 # Finish Exam Session
 @exam_router.post("/exam/attempt/{attempt_id}/finish", response_model=schemas.ExamResult)
-async def finish_exam_session(attempt_id: int, current_user_data: schemas.TokenData = Depends(get_current_active_student), db: Session = Depends(get_db)):
+async def finish_exam_session(attempt_id: int, current_user_data: schemas.TokenData = Depends(get_current_active_student), db: AsyncSession = Depends(get_db)):
     student_id = current_user_data.student_id
     now_utc = datetime.now()
 
-    attempt_model = db.query(models.ScheduledAttempt).filter(
-        models.ScheduledAttempt.id == attempt_id,
-        models.ScheduledAttempt.student_id == student_id
-    ).first()
-    
+    attempt_model = (await db.scalars(
+        select(models.ScheduledAttempt).options(
+            *_guarded(joinedload(models.ScheduledAttempt.schedule).joinedload(models.ExamSchedule.subject))
+        ).where(
+            models.ScheduledAttempt.id == attempt_id,
+            models.ScheduledAttempt.student_id == student_id
+        )
+    )).first()
+
     if not attempt_model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exam Attempt not found or access denied.")
-        
+
     if attempt_model.end_time:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="This exam has already been finalized.")
 
@@ -236,61 +463,37 @@ async def finish_exam_session(attempt_id: int, current_user_data: schemas.TokenD
     subject_model = schedule_model.subject
     elapsed_time_seconds = (now_utc - attempt_model.start_time).total_seconds()
     time_limit_seconds = schedule_model.duration_minutes * 60
-    
+
     is_time_up = (elapsed_time_seconds >= time_limit_seconds)
 
     if is_time_up:
         elapsed_time_seconds = time_limit_seconds
-        
+
     attempt_model.end_time = now_utc
-    
-    total_questions = db.query(models.Question).filter(
-        models.Question.schedule_id == schedule_model.id
-    ).count()
-
-    subject_score_query = (
-        db.query(
-            models.Subject.id.label('subject_id'),
-            models.Subject.name.label('subject_name'),
-            func.sum(case((models.UserAnswer.is_correct == True, 1), else_=0)).label('correct_answers'),
-            func.count(models.UserAnswer.id).label('total_answered_questions')
-        )
-        .join(models.Question, models.UserAnswer.question_id == models.Question.id)
-        .join(models.ExamSchedule, models.Question.schedule_id == models.ExamSchedule.id)
-        .join(models.Subject, models.ExamSchedule.subject_id == models.Subject.id)
-        .filter(models.UserAnswer.attempt_id == attempt_id)
-        .group_by(models.Subject.id, models.Subject.name)
-        .first()
-    )
 
-    if subject_score_query is None:
-        subject_report = schemas.SubjectScoreDetail(
-            subject_id=subject_model.id,
-            subject_name=subject_model.name,
-            correct_answers=0,
-            total_answered_questions=0
-        )
-    else:
-        subject_report = schemas.SubjectScoreDetail(
-            subject_id=subject_score_query.subject_id,
-            subject_name=subject_score_query.subject_name,
-            correct_answers=subject_score_query.correct_answers,
-            total_answered_questions=subject_score_query.total_answered_questions
-        )
-        
-    subject_breakdown_json = subject_report.model_dump_json()
+    total_questions = await _total_questions_for(db, schedule_model.id)
+
+    # The attempt's score and answered_count counters are maintained by
+    # submit_answer, so the report needs no aggregation over the answers.
+    subject_report = schemas.SubjectScoreDetail(
+        subject_id=subject_model.id,
+        subject_name=subject_model.name,
+        correct_answers=attempt_model.score,
+        total_answered_questions=attempt_model.answered_count
+    )
 
     new_report = models.FinalReport(
         attempt_id=attempt_id,
-        subject_scores_json=subject_breakdown_json,
+        subject_scores_json=subject_report.model_dump(),
         final_score=attempt_model.score,
+        total_questions=total_questions,
         time_taken_seconds=int(elapsed_time_seconds),
     )
     db.add(new_report)
-    db.commit()
-    
+    await db.commit()
+
     final_score = attempt_model.score
-    
+
     return schemas.ExamResult(
         attempt_id=attempt_id,
         final_score=final_score,
@@ -303,38 +506,45 @@ async def finish_exam_session(attempt_id: int, current_user_data: schemas.TokenD
 
 # Get Exam Report
 @exam_router.get("/exam/attempt/{attempt_id}/report", response_model=schemas.ExamResult)
-async def get_exam_report(attempt_id: int, current_user_data: schemas.TokenData = Depends(get_current_active_student), db: Session = Depends(get_db)):
+async def get_exam_report(attempt_id: int, current_user_data: schemas.TokenData = Depends(get_current_active_student), db: AsyncSession = Depends(get_db)):
     student_id = current_user_data.student_id
 
-    report_model = db.query(models.FinalReport).filter(
-        models.FinalReport.attempt_id == attempt_id,
-        models.FinalReport.attempt.has(models.ScheduledAttempt.student_id == student_id)
-    ).first()
-    
+    report_model = (await db.scalars(
+        select(models.FinalReport).options(
+            *_guarded(
+                joinedload(models.FinalReport.attempt)
+                .joinedload(models.ScheduledAttempt.schedule)
+                .joinedload(models.ExamSchedule.subject)
+            )
+        ).where(
+            models.FinalReport.attempt_id == attempt_id,
+            models.FinalReport.attempt.has(models.ScheduledAttempt.student_id == student_id)
+        )
+    )).first()
+
     if not report_model:
         raise HTTPException(
-            status_code=404, 
+            status_code=404,
             detail="Exam Report not found. The exam may not be completed."
         )
 
     attempt_model = report_model.attempt
     schedule_model = attempt_model.schedule
     subject_model = schedule_model.subject
-    
+
     if attempt_model.end_time is None:
          raise HTTPException(status_code=400, detail="The exam is not yet finished.")
 
-    subject_breakdown_data = json.loads(report_model.subject_scores_json)
-    subject_report = schemas.SubjectScoreDetail(**subject_breakdown_data)
-    
-    total_questions = db.query(models.Question).filter(
-        models.Question.schedule_id == schedule_model.id
-    ).count()
+    subject_report = schemas.SubjectScoreDetail(**report_model.subject_scores_json)
+
+    # Snapshotted on the report at finish time, so later question edits
+    # don't retroactively change a finalized percentage.
+    total_questions = report_model.total_questions
 
     time_limit_seconds = schedule_model.duration_minutes * 60
     is_time_up_submission = (report_model.time_taken_seconds >= time_limit_seconds)
     final_score = report_model.final_score
-    
+
     return schemas.ExamResult(
         attempt_id=attempt_id,
         final_score=final_score,
@@ -349,580 +559,764 @@ async def get_exam_report(attempt_id: int, current_user_data: schemas.TokenData
 # ============= CLASS ============
 # Create Class
 @admin_router.post("/classes", response_model=schemas.ClassDisplay)
-async def create_class(class_data: schemas.Class, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
-    existing_class = db.query(models.Class).filter(models.Class.name == class_data.name).first()
-    
-    if existing_class:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Class name already exists.")
-    
+async def create_class(class_data: schemas.Class, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
+    # No preflight SELECT: the unique constraint on the name is the
+    # authority, and checking first would race under concurrency anyway.
     class_model = models.Class(name=class_data.name)
 
     db.add(class_model)
-    db.commit()
-    db.refresh(class_model)
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise _integrity_conflict(exc, "Class name already exists.")
 
+    # expire_on_commit=False keeps the instance populated (id included from
+    # the INSERT's RETURNING), so no post-commit refresh round-trip.
     return class_model
 
 # Get all classes
 @admin_router.get("/classes", response_model=List[schemas.ClassDisplay])
-async def read_classes(admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
-    classes = db.query(models.Class).all()
+async def read_classes(admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
+    classes = (await db.scalars(select(models.Class))).all()
     return classes
 
 # Update class
 @admin_router.put("/classes/{class_id}", response_model=schemas.ClassDisplay)
-async def update_class(class_id: int, class_data: schemas.Class, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
-    class_model = db.query(models.Class).filter(models.Class.id == class_id).first()
-    
+async def update_class(class_id: int, class_data: schemas.Class, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
+    class_model = (await db.scalars(
+        select(models.Class).where(models.Class.id == class_id)
+    )).first()
+
     if not class_model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Class not found.")
-    
+
     new_name = class_data.name
-    
-    if new_name != class_model.name:
-        existing_class = db.query(models.Class).filter(models.Class.name == new_name).first()
-        
-        if existing_class:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"The class name '{new_name}' already exists. Class names must be unique."
-            )
-            
+
     class_model.name = new_name
-    
+
     db.add(class_model)
-    db.commit()
-    db.refresh(class_model)
-    
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise _integrity_conflict(
+            exc,
+            f"The class name '{new_name}' already exists. Class names must be unique."
+        )
+
     return class_model
 
 # Delete class
 @admin_router.delete("/classes/{class_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_class(class_id: int, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
-    class_model = db.query(models.Class).filter(models.Class.id == class_id).first()
-    
+async def delete_class(class_id: int, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
+    class_model = (await db.scalars(
+        select(models.Class).where(models.Class.id == class_id)
+    )).first()
+
     if not class_model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Class not found.")
-    
-    student_count = db.query(models.Student).filter(models.Student.class_id == class_id).count()
-    schedule_count = db.query(models.ExamSchedule).filter(models.ExamSchedule.class_id == class_id).count()
-    
-    if student_count > 0 or schedule_count > 0:
-        detail_msg = f"Cannot delete Class ID {class_id}. Linked records exist: {student_count} students, {schedule_count} schedules."
+
+    # EXISTS stops at the first linked row instead of counting them all;
+    # selecting both probes in one statement costs a single round-trip.
+    has_students, has_schedules = (await db.execute(
+        select(
+            select(literal(True)).where(models.Student.class_id == class_id).exists(),
+            select(literal(True)).where(models.ExamSchedule.class_id == class_id).exists(),
+        )
+    )).one()
+
+    if has_students or has_schedules:
+        detail_msg = f"Cannot delete Class ID {class_id}. Students or schedules are still linked to it."
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail_msg)
 
-    db.delete(class_model)
-    db.commit()
+    await db.delete(class_model)
+    await db.commit()
     return
 
 
 # ============= SCHEDULE ============
 # Create Schedule
 @admin_router.post("/schedules", response_model=schemas.ExamScheduleDisplay)
-async def create_schedule(schedule_data: schemas.ExamSchedule, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def create_schedule(schedule_data: schemas.ExamSchedule, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """Creates a new exam slot, locking a subject to a class, date, and password."""
-    
-    if not db.query(models.Subject).get(schedule_data.subject_id):
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Subject not found.")
-    
-    if not db.query(models.Class).get(schedule_data.class_id):
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Class not found.")
 
-    schedule_model = models.ExamSchedule(**schedule_data.model_dump())
+    schedule_payload = schedule_data.model_dump()
+    schedule_payload["exam_password"] = hash_exam_password(schedule_payload["exam_password"])
+
+    schedule_model = models.ExamSchedule(**schedule_payload)
     db.add(schedule_model)
-    
+
     try:
-        db.commit()
-        db.refresh(schedule_model)
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise _integrity_conflict(
+            exc,
+            "Schedule conflicts with existing records.",
+            "Subject or Class not found."
+        )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Database error during schedule creation: {e}")
-    
+    await db.refresh(schedule_model, ["subject"])
+
     data = schedule_model.__dict__.copy()
     data["subject_name"] = schedule_model.subject.name
     return schemas.ExamScheduleDisplay.model_validate(data)
 
 # Get all schedules
 @admin_router.get("/schedules", response_model=List[schemas.ExamScheduleDisplay])
-async def read_schedules(class_id: Optional[int] = None, exam_date: Optional[date] = None, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def read_schedules(class_id: Optional[int] = None, exam_date: Optional[date] = None, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """Retrieves all exam schedules, optionally filtered by class or date."""
-    shedule_model = db.query(models.ExamSchedule).options(joinedload(models.ExamSchedule.subject), joinedload(models.ExamSchedule.exam_class))
-    
+    # Column projection instead of ORM hydration: the listing only needs
+    # the display fields plus the subject/class names from the join.
+    schedule_query = _schedule_listing_query()
+
     if class_id is not None:
-        shedule_model = shedule_model.filter(models.ExamSchedule.class_id == class_id)
-    
+        schedule_query = schedule_query.where(models.ExamSchedule.class_id == class_id)
+
     if exam_date is not None:
-        shedule_model = shedule_model.filter(models.ExamSchedule.exam_date == exam_date)
-        
-    schedules = shedule_model.all()
-    
-    return [
-        schemas.ExamScheduleDisplay.model_validate(
-            {**s.__dict__, "subject_name": s.subject.name}
-        )
-        for s in schedules
-    ]
+        schedule_query = schedule_query.where(models.ExamSchedule.exam_date == exam_date)
+
+    rows = (await db.execute(schedule_query)).all()
+
+    return [_schedule_display_from_row(row) for row in rows]
 
 # Get all schedules for a perticular date
 @admin_router.get("/schedules/{exam_date}", response_model=List[schemas.ExamScheduleDisplay])
-async def read_schedules(exam_date: Optional[date] = None, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def read_schedules(exam_date: Optional[date] = None, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """Retrieves all exam schedules, optionally filtered by class or date."""
-    shedule_model = db.query(models.ExamSchedule).options(joinedload(models.ExamSchedule.subject), joinedload(models.ExamSchedule.exam_class))
-    
+    schedule_query = _schedule_listing_query()
+
     if exam_date is not None:
-        shedule_model = shedule_model.filter(models.ExamSchedule.exam_date == exam_date)
-        
-    shedule_model = shedule_model.filter(models.ExamSchedule.exam_date == datetime.now().date())
-        
-    schedules = shedule_model.all()
-    
-    return [
-        schemas.ExamScheduleDisplay.model_validate(
-            {**s.__dict__, "subject_name": s.subject.name}
-        )
-        for s in schedules
-    ]
+        schedule_query = schedule_query.where(models.ExamSchedule.exam_date == exam_date)
+
+    schedule_query = schedule_query.where(models.ExamSchedule.exam_date == datetime.now().date())
+
+    rows = (await db.execute(schedule_query)).all()
+
+    return [_schedule_display_from_row(row) for row in rows]
 
 
 # Update Schedule
 @admin_router.put("/schedules/{schedule_id}", response_model=schemas.ExamScheduleDisplay)
-async def update_schedule(schedule_id: int, schedule_data: schemas.ExamSchedule, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def update_schedule(schedule_id: int, schedule_data: schemas.ExamSchedule, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """Updates an existing exam schedule."""
-    
-    schedule_model = db.query(models.ExamSchedule).filter(models.ExamSchedule.id == schedule_id).first()
-    
+
+    # Load the subject up front so the response doesn't need a post-commit
+    # refetch; only a change of subject_id invalidates what was loaded.
+    schedule_model = (await db.scalars(
+        select(models.ExamSchedule).options(
+            joinedload(models.ExamSchedule.subject)
+        ).where(models.ExamSchedule.id == schedule_id)
+    )).first()
+
     if not schedule_model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Exam Schedule with ID {schedule_id} not found.")
 
     update_data = schedule_data.model_dump(exclude_unset=True)
-    
-    if 'subject_id' in update_data and not db.query(models.Subject).get(update_data['subject_id']):
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="New subject ID not found.")
-    
-    if 'class_id' in update_data and not db.query(models.Class).get(update_data['class_id']):
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="New class ID not found.")
+
+    if 'exam_password' in update_data:
+        update_data['exam_password'] = hash_exam_password(update_data['exam_password'])
+
+    subject_changed = 'subject_id' in update_data and update_data['subject_id'] != schedule_model.subject_id
 
     for key, value in update_data.items():
         setattr(schedule_model, key, value)
 
     db.add(schedule_model)
-    db.commit()
-    db.refresh(schedule_model)
-    
-    schedule_updated = db.query(models.ExamSchedule).options(joinedload(models.ExamSchedule.subject)).filter(models.ExamSchedule.id == schedule_id).first()
-    
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise _integrity_conflict(
+            exc,
+            "Schedule conflicts with existing records.",
+            "New subject or class ID not found."
+        )
+
+    if subject_changed:
+        await db.refresh(schedule_model, ["subject"])
+
+    await exam_cache.invalidate_exam_payload(schedule_id)
+
     data = schedule_model.__dict__.copy()
-    data["subject_name"] = schedule_updated.subject.name
-    
+    data["subject_name"] = schedule_model.subject.name
+
     return schemas.ExamScheduleDisplay.model_validate(data)
 
 # Delete Schedule
 @admin_router.delete("/schedules/{schedule_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_schedule(schedule_id: int, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def delete_schedule(schedule_id: int, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """Deletes an exam schedule only if no student has attempted it and no questions are linked."""
-    
-    schedule_model = db.query(models.ExamSchedule).filter(models.ExamSchedule.id == schedule_id).first()
-    
+
+    schedule_model = (await db.scalars(
+        select(models.ExamSchedule).where(models.ExamSchedule.id == schedule_id)
+    )).first()
+
     if not schedule_model:
-        raise HTTPException(status_code=status.status.HTTP_404_NOT_FOUND, detail=f"Exam Schedule with ID {schedule_id} not found.")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Exam Schedule with ID {schedule_id} not found.")
 
-    attempt_count = db.query(models.ScheduledAttempt).filter(models.ScheduledAttempt.schedule_id == schedule_id).count()
+    has_attempts, has_questions = (await db.execute(
+        select(
+            select(literal(True)).where(models.ScheduledAttempt.schedule_id == schedule_id).exists(),
+            select(literal(True)).select_from(models.Question).join(
+                models.QuestionGroup, models.Question.group_id == models.QuestionGroup.id
+            ).where(models.QuestionGroup.schedule_id == schedule_id).exists(),
+        )
+    )).one()
 
-    if attempt_count > 0:
+    if has_attempts:
         raise HTTPException(
-            status_code=status.status.HTTP_400_BAD_REQUEST, 
-            detail=f"Cannot delete schedule. {attempt_count} student attempts are already recorded for this exam."
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot delete schedule. Student attempts are already recorded for this exam."
         )
 
-    question_count = db.query(models.Question).filter(models.Question.schedule_id == schedule_id).count()
-
-    if question_count > 0:
+    if has_questions:
          raise HTTPException(
-            status_code=status.status.HTTP_400_BAD_REQUEST, 
-            detail=f"Cannot delete schedule. {question_count} questions are linked. Delete questions first."
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot delete schedule. Questions are still linked. Delete questions first."
         )
-         
-    db.delete(schedule_model) 
-    db.commit()
-    
+
+    await db.delete(schedule_model)
+    await db.commit()
+
+    await exam_cache.invalidate_exam_payload(schedule_id)
+    await exam_cache.invalidate_schedule_groups(schedule_id)
+
     return
 
 # Dashboard schedule route
 @exam_router.get("/dashboard/schedule", response_model=schemas.ExamScheduleDashboard)
-async def get_student_exam_schedule(token_data: schemas.TokenData = Depends(get_current_active_student), db: Session = Depends(get_db)):
-    
+async def get_student_exam_schedule(token_data: schemas.TokenData = Depends(get_current_active_student), db: AsyncSession = Depends(get_db)):
+
     schedule_id = token_data.schedule_id
-    
-    schedule_model = db.query(models.ExamSchedule).options(
-        joinedload(models.ExamSchedule.subject),
-        joinedload(models.ExamSchedule.question_groups).joinedload(models.QuestionGroup.questions)
-    ).filter(
-        models.ExamSchedule.id == schedule_id,
-        models.ExamSchedule.class_id == token_data.class_id
-    ).first()
-    
+
+    schedule_model = (await db.scalars(
+        select(models.ExamSchedule).options(
+            joinedload(models.ExamSchedule.subject)
+        ).where(
+            models.ExamSchedule.id == schedule_id,
+            models.ExamSchedule.class_id == token_data.class_id
+        )
+    )).first()
+
     if not schedule_model:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, 
+            status_code=status.HTTP_404_NOT_FOUND,
             detail="Scheduled exam not found or not assigned to your class."
         )
 
-    number_of_groups = len(schedule_model.question_groups)
-    total_questions = sum(
-        len(group.questions) for group in schedule_model.question_groups
-    )
-    
+    # The dashboard only shows counts, so aggregate in the database instead
+    # of materializing every group and question just to len() them.
+    number_of_groups, total_questions = (await db.execute(
+        select(
+            func.count(func.distinct(models.QuestionGroup.id)),
+            func.count(models.Question.id),
+        )
+        .select_from(models.QuestionGroup)
+        .outerjoin(models.Question, models.Question.group_id == models.QuestionGroup.id)
+        .where(models.QuestionGroup.schedule_id == schedule_id)
+    )).one()
+
     data = schedule_model.__dict__.copy()
     data["subject_name"] = schedule_model.subject.name
     data["number_of_groups"] = number_of_groups
     data["total_questions"] = total_questions
-    
+
     return schemas.ExamScheduleDashboard.model_validate(data)
 
 
 # ============= STUDENT ============
 # Create Student
 @admin_router.post("/students", response_model=schemas.StudentDisplay)
-async def create_student(student_data: schemas.Student, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def create_student(student_data: schemas.Student, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """Enrolls a new student with a unique registration number and class."""
-    
-    if not db.query(models.Class).get(student_data.class_id):
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Class ID {student_data.class_id} not found.")
-
-    existing_student = db.query(models.Student).filter(models.Student.reg_number == student_data.reg_number).first()
-    
-    if existing_student:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Registration number already exists.")
 
     student_model = models.Student(**student_data.model_dump())
-    
+
     db.add(student_model)
-    db.commit()
-    db.refresh(student_model)
-    
-    return student_model
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise _integrity_conflict(
+            exc,
+            "Registration number already exists.",
+            f"Class ID {student_data.class_id} not found."
+        )
+
+    # One scalar SELECT for the class name instead of refreshing the
+    # relationship into a full Class instance.
+    class_name = await db.scalar(
+        select(models.Class.name).where(models.Class.id == student_model.class_id)
+    )
+
+    return schemas.StudentDisplay(
+        id=student_model.id,
+        full_name=student_model.full_name,
+        reg_number=student_model.reg_number,
+        class_id=student_model.class_id,
+        class_name=class_name,
+        student_class=(
+            schemas.ClassDisplay(id=student_model.class_id, name=class_name)
+            if class_name is not None else None
+        ),
+    )
 
 # Get All Students
 @admin_router.get("/students", response_model=List[schemas.StudentDisplay])
-async def read_students(class_id: Optional[int] = None, limit: int = 100, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def read_students(class_id: Optional[int] = None, limit: int = 100, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """Retrieves all students, filterable by class ID."""
-    student_model = db.query(models.Student)
-    
+    # Column projection with the class name joined in, instead of ORM
+    # hydration plus a per-object validator copying student_class.name.
+    student_query = (
+        select(
+            models.Student.id,
+            models.Student.full_name,
+            models.Student.reg_number,
+            models.Student.class_id,
+            models.Class.name.label("class_name"),
+        )
+        .outerjoin(models.Class, models.Student.class_id == models.Class.id)
+    )
+
     if class_id is not None:
-        student_model = student_model.filter(models.Student.class_id == class_id)
-        
-    students = student_model.limit(limit).all()
-    return students
+        student_query = student_query.where(models.Student.class_id == class_id)
+
+    rows = (await db.execute(student_query.limit(limit))).all()
+    return [_student_display_from_row(row) for row in rows]
 
 # Update Student
 @admin_router.put("/students/{student_id}", response_model=schemas.StudentDisplay)
-async def update_student(student_id: int, student_data: schemas.Student, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def update_student(student_id: int, student_data: schemas.Student, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """Updates an existing student's details."""
-    student_model = db.query(models.Student).filter(models.Student.id == student_id).first()
-    
+    student_model = (await db.scalars(
+        select(models.Student).where(models.Student.id == student_id)
+    )).first()
+
     if not student_model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Student ID {student_id} not found.")
 
     update_data = student_data.model_dump(exclude_unset=True)
-    
-    if 'class_id' in update_data and not db.query(models.Class).get(update_data['class_id']):
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="New Class ID not found.")
-
-    if 'reg_number' in update_data:
-        existing_student = db.query(models.Student).filter(models.Student.reg_number == update_data['reg_number'], models.Student.id != student_id).first()
-        
-        if existing_student:
-            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Registration number is already in use by another student.")
 
     for key, value in update_data.items():
         setattr(student_model, key, value)
 
     db.add(student_model)
-    db.commit()
-    db.refresh(student_model)
-    
-    return student_model
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise _integrity_conflict(
+            exc,
+            "Registration number is already in use by another student.",
+            "New Class ID not found."
+        )
+
+    class_name = await db.scalar(
+        select(models.Class.name).where(models.Class.id == student_model.class_id)
+    )
+
+    return schemas.StudentDisplay(
+        id=student_model.id,
+        full_name=student_model.full_name,
+        reg_number=student_model.reg_number,
+        class_id=student_model.class_id,
+        class_name=class_name,
+        student_class=(
+            schemas.ClassDisplay(id=student_model.class_id, name=class_name)
+            if class_name is not None else None
+        ),
+    )
 
 # Delete Student
 @admin_router.delete("/students/{student_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_student(student_id: int, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def delete_student(student_id: int, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """Deletes a student and all associated exam attempt records."""
-    student_model = db.query(models.Student).filter(models.Student.id == student_id).first()
-    
+    student_model = (await db.scalars(
+        select(models.Student).where(models.Student.id == student_id)
+    )).first()
+
     if not student_model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Student ID {student_id} not found.")
 
-    active_attempts = db.query(models.ScheduledAttempt).filter(models.ScheduledAttempt.student_id == student_id, models.ScheduledAttempt.end_time.is_(None)).count()
+    has_active_attempt = await _exists(
+        db, models.ScheduledAttempt,
+        models.ScheduledAttempt.student_id == student_id,
+        models.ScheduledAttempt.end_time.is_(None)
+    )
 
-    if active_attempts > 0:
+    if has_active_attempt:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot delete student with an active, unfinished exam attempt.")
 
-    db.delete(student_model)
-    db.commit()
-    
+    await db.delete(student_model)
+    await db.commit()
+
     return
 
 
 # ============= SUBJECT ============
 # Create Subject
 @admin_router.post("/subjects", response_model=schemas.SubjectDisplay)
-async def create_subject(subject_data: schemas.Subject, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def create_subject(subject_data: schemas.Subject, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """Creates a new exam subject."""
-    existing_subject = db.query(models.Subject).filter(models.Subject.name == subject_data.name).first()
-    
-    if existing_subject:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Subject name already exists.")
-    
     subject_model = models.Subject(name=subject_data.name)
-    
+
     db.add(subject_model)
-    db.commit()
-    db.refresh(subject_model)
-    
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise _integrity_conflict(exc, "Subject name already exists.")
+
+    # expire_on_commit=False keeps the instance populated (id included from
+    # the INSERT's RETURNING), so no post-commit refresh round-trip.
     return subject_model
 
 # Get all subjects
 @admin_router.get("/subjects", response_model=List[schemas.SubjectDisplay])
-async def read_all_subjects(admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def read_all_subjects(admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """Retrieves all subjects."""
-    
-    subjects =  db.query(models.Subject).all()
-    
-    return subjects
+
+    # question_count comes from a grouped aggregate instead of a computed
+    # Python property probing relationships per row.
+    rows = (await db.execute(
+        select(
+            models.Subject.id,
+            models.Subject.name,
+            func.count(models.Question.id).label("question_count"),
+        )
+        .outerjoin(models.ExamSchedule, models.ExamSchedule.subject_id == models.Subject.id)
+        .outerjoin(models.QuestionGroup, models.QuestionGroup.schedule_id == models.ExamSchedule.id)
+        .outerjoin(models.Question, models.Question.group_id == models.QuestionGroup.id)
+        .group_by(models.Subject.id, models.Subject.name)
+    )).all()
+
+    return [
+        schemas.SubjectDisplay(id=row.id, name=row.name, question_count=row.question_count)
+        for row in rows
+    ]
 
 # Get a Subject
 @admin_router.get("/subjects/{subject_id}", response_model=schemas.SubjectDisplay)
-async def read_subject(subject_id: int, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def read_subject(subject_id: int, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """Retrieves a single subject."""
-    
-    subject_model = db.query(models.Subject).filter(models.Subject.id == subject_id).first()
-    
-    if not subject_model:
+
+    row = (await db.execute(
+        select(
+            models.Subject.id,
+            models.Subject.name,
+            func.count(models.Question.id).label("question_count"),
+        )
+        .outerjoin(models.ExamSchedule, models.ExamSchedule.subject_id == models.Subject.id)
+        .outerjoin(models.QuestionGroup, models.QuestionGroup.schedule_id == models.ExamSchedule.id)
+        .outerjoin(models.Question, models.Question.group_id == models.QuestionGroup.id)
+        .where(models.Subject.id == subject_id)
+        .group_by(models.Subject.id, models.Subject.name)
+    )).first()
+
+    if not row:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Subject not found.")
-    
-    return subject_model
+
+    return schemas.SubjectDisplay(id=row.id, name=row.name, question_count=row.question_count)
 
 # Update Subject
 @admin_router.put("/subjects/{subject_id}", response_model=schemas.SubjectDisplay)
-async def update_subject(subject_id: int, subject_data: schemas.Subject, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def update_subject(subject_id: int, subject_data: schemas.Subject, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """Updates the name of an existing subject."""
-    
-    subject_model = db.query(models.Subject).filter(models.Subject.id == subject_id).first()
-    
+
+    subject_model = (await db.scalars(
+        select(models.Subject).where(models.Subject.id == subject_id)
+    )).first()
+
     if not subject_model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Subject not found.")
-    
+
     new_name = subject_data.name
-    
-    if new_name != subject_model.name:
-        existing_subject = db.query(models.Subject).filter(models.Subject.name == new_name).first()
-        
-        if existing_subject:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"The subject name '{new_name}' already exists. Subject names must be unique."
-            )
-    
+
     subject_model.name = new_name
 
     db.add(subject_model)
-    db.commit()
-    db.refresh(subject_model)
-    
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise _integrity_conflict(
+            exc,
+            f"The subject name '{new_name}' already exists. Subject names must be unique."
+        )
+
     return subject_model
 
 # Delete Subject
 @admin_router.delete("/subjects/{subject_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_subject(subject_id: int, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def delete_subject(subject_id: int, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """Deletes a subject. Requires checking for linked content."""
-    
-    subject_model = db.query(models.Subject).filter(models.Subject.id == subject_id).first()
-    
+
+    subject_model = (await db.scalars(
+        select(models.Subject).where(models.Subject.id == subject_id)
+    )).first()
+
     if not subject_model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Subject not found.")
 
-    question_count = db.query(models.Question).join(models.ExamSchedule).filter(models.ExamSchedule.subject_id == subject_id).count()
-    if question_count > 0:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Cannot delete subject. {question_count} questions are still linked to it.")
+    has_questions, has_schedules = (await db.execute(
+        select(
+            select(literal(True)).select_from(models.Question).join(
+                models.QuestionGroup, models.Question.group_id == models.QuestionGroup.id
+            ).join(
+                models.ExamSchedule, models.QuestionGroup.schedule_id == models.ExamSchedule.id
+            ).where(models.ExamSchedule.subject_id == subject_id).exists(),
+            select(literal(True)).where(models.ExamSchedule.subject_id == subject_id).exists(),
+        )
+    )).one()
+
+    if has_questions:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot delete subject. Questions are still linked to it.")
 
-    schedule_count = db.query(models.ExamSchedule).filter(models.ExamSchedule.subject_id == subject_id).count()
-    if schedule_count > 0:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Cannot delete subject. {schedule_count} exam schedules are linked to it.")
+    if has_schedules:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot delete subject. Exam schedules are linked to it.")
+
+    await db.delete(subject_model)
+    await db.commit()
 
-    db.delete(subject_model)
-    db.commit()
-    
     return
 
 
 # ============= QUESTION ============
 # Create Question for a specific scheduled exam
 @admin_router.post("/groups/{group_id}/questions", response_model=schemas.QuestionStudentDisplay)
-async def create_question_and_options(group_id: int, question_data: schemas.Question, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def create_question_and_options(group_id: int, question_data: schemas.Question, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """
     Creates a new question and its options, linking it to a specific Question Group.
     """
-    group_model = db.query(models.QuestionGroup).get(group_id)
-    if not group_model:
+    # Only schedule_id is needed (for cache invalidation), so project it
+    # instead of hydrating the whole group.
+    schedule_id = await db.scalar(
+        select(models.QuestionGroup.schedule_id).where(models.QuestionGroup.id == group_id)
+    )
+    if schedule_id is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question Group not found.")
 
-    correct_options = [opt for opt in question_data.options if opt.is_correct]
-    if len(correct_options) != 1:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Exactly one option must be marked as correct.")
-        
     if not question_data.options:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="A question must have at least one option.")
 
+    correct_index = _correct_option_index(question_data.options)
+
     question_model = models.Question(
         group_id=group_id,
         question_text=question_data.question_text,
         question_number=question_data.question_number
     )
     db.add(question_model)
-    db.flush() 
-
-    correct_option_id = None
-    
-    for option_data in question_data.options:
-        option_model = models.Option(option_text=option_data.option_text, question_id=question_model.id)
-        db.add(option_model)
-        db.flush() 
-        
-        if option_data.is_correct:
-            correct_option_id = option_model.id
-            
-    question_model.correct_option_id = correct_option_id
-    
-    db.commit()
-    db.refresh(question_model)
-    
-    question_model_complete = db.query(models.Question).options(joinedload(models.Question.options)).filter(models.Question.id == question_model.id).first()
-    
-    return question_model_complete
+    await db.flush()
+
+    # One INSERT for all options; sort_by_parameter_order keeps the
+    # RETURNING ids aligned with the submitted options so the correct one
+    # can be matched back without per-row flushes.
+    option_ids = (await db.execute(
+        insert(models.Option).returning(models.Option.id, sort_by_parameter_order=True),
+        [
+            {"option_text": option_data.option_text, "question_id": question_model.id}
+            for option_data in question_data.options
+        ],
+    )).scalars().all()
+
+    question_model.correct_option_id = option_ids[correct_index]
+
+    await db.commit()
+    await exam_cache.invalidate_question_count(schedule_id)
+    await exam_cache.invalidate_exam_payload(schedule_id)
+    await exam_cache.invalidate_group_questions(group_id)
+    await exam_cache.invalidate_schedule_groups(schedule_id)
+
+    # Everything the response needs is already in memory: the question row
+    # plus the option ids returned by the bulk insert. No refetch.
+    return schemas.QuestionStudentDisplay(
+        id=question_model.id,
+        group_id=question_model.group_id,
+        question_number=question_model.question_number,
+        question_text=question_model.question_text,
+        options=[
+            schemas.OptionStudentDisplay(id=option_id, option_text=option_data.option_text)
+            for option_id, option_data in zip(option_ids, question_data.options)
+        ],
+    )
 
 # Read all Questions for a specific question group
 @admin_router.get("/groups/{group_id}/questions", response_model=list[schemas.QuestionStudentDisplay])
-async def read_questions(group_id: int, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
-    
-    question_model = db.query(models.Question).options(joinedload(models.Question.options)
-            ).filter(models.Question.group_id == group_id).all()
-    
+async def read_questions(group_id: int, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
+
+    # Cached listings already passed response validation when first built,
+    # so hits skip both the query and Pydantic.
+    cached = await exam_cache.get_group_questions(group_id)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    question_model = (await db.scalars(
+        select(models.Question).options(*_guarded(joinedload(models.Question.options))
+            ).where(models.Question.group_id == group_id)
+    )).unique().all()
+
     if not question_model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question not found for this group.")
-        
+
+    await exam_cache.set_group_questions(group_id, [
+        schemas.QuestionStudentDisplay.model_validate(question).model_dump()
+        for question in question_model
+    ])
+
     return question_model
 
 # Read all Questions
 @admin_router.get("/questions/", response_model=list[schemas.QuestionStudentDisplay])
-async def read_question(admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
-    """Retrieves all questions and their options."""    
-    question_model = db.query(models.Question).options(joinedload(models.Question.options)).all()
-    
+async def read_question(admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
+    """Retrieves all questions and their options."""
+    question_model = (await db.scalars(
+        select(models.Question).options(*_guarded(joinedload(models.Question.options)))
+    )).unique().all()
+
     if not question_model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No questions found.")
-        
+
     return question_model
 
 # Read Question for a specific scheduled exam
 @admin_router.get("/groups/{group_id}/questions/{question_id}", response_model=schemas.QuestionStudentDisplay)
-async def read_question(group_id: int, question_id: int, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def read_question(group_id: int, question_id: int, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """Retrieves a single question and its options for a specific group."""
-    
-    question_model = db.query(models.Question).options(joinedload(models.Question.options)
-            ).filter(models.Question.id == question_id, models.Question.group_id == group_id).first()
-    
+
+    question_model = (await db.scalars(
+        select(models.Question).options(*_guarded(joinedload(models.Question.options))
+            ).where(models.Question.id == question_id, models.Question.group_id == group_id)
+    )).unique().first()
+
     if not question_model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question not found for this group.")
-        
+
     return question_model
 
 # Update Question for a specific scheduled exam
 @admin_router.put("/groups/{group_id}/questions/{question_id}", response_model=schemas.QuestionStudentDisplay)
-async def update_question(group_id: int, question_id: int, question_data: schemas.Question, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def update_question(group_id: int, question_id: int, question_data: schemas.Question, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """Updates a question's text, number, and completely replaces all its options within a group."""
-    
-    question_model = db.query(models.Question).filter(models.Question.id == question_id, models.Question.group_id == group_id).first()
-    
+
+    question_model = (await db.scalars(
+        select(models.Question).where(models.Question.id == question_id, models.Question.group_id == group_id)
+    )).first()
+
     if not question_model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question not found for this group.")
 
-    correct_options = [opt for opt in question_data.options if opt.is_correct]
-    if len(correct_options) != 1:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Exactly one option must be marked as correct.")
+    correct_index = _correct_option_index(question_data.options)
 
     question_model.question_text = question_data.question_text
     question_model.question_number = question_data.question_number
 
-    db.query(models.Option).filter(models.Option.question_id == question_id).delete(synchronize_session=False)
-    db.flush()
-
-    new_correct_option_id = None
-    
-    for option_data in question_data.options:
-        option_model = models.Option(option_text=option_data.option_text, question_id=question_model.id)
-        db.add(option_model)
-        db.flush()
-        
-        if option_data.is_correct:
-            new_correct_option_id = option_model.id
-            
-    question_model.correct_option_id = new_correct_option_id
-
-    db.commit()
-    
-    question_model_updated = db.query(models.Question).options(joinedload(models.Question.options)).filter(models.Question.id == question_id).first()
-    
-    return question_model_updated
+    # Diff against the stored options instead of delete-all + re-insert:
+    # the usual edit touches one option's text, so pair rows with the
+    # submitted list positionally and only UPDATE the texts that changed,
+    # INSERT the surplus new ones, DELETE the surplus old ones.
+    current_options = (await db.execute(
+        select(models.Option.id, models.Option.option_text)
+        .where(models.Option.question_id == question_id)
+        .order_by(models.Option.id)
+    )).all()
+
+    shared = min(len(current_options), len(question_data.options))
+    option_ids = [row.id for row in current_options[:shared]]
+
+    changed_texts = [
+        {"id": row.id, "option_text": option_data.option_text}
+        for row, option_data in zip(current_options, question_data.options)
+        if row.option_text != option_data.option_text
+    ]
+    if changed_texts:
+        # ORM bulk UPDATE by primary key: one executemany statement.
+        await db.execute(update(models.Option), changed_texts)
+
+    if len(question_data.options) > shared:
+        option_ids.extend((await db.execute(
+            insert(models.Option).returning(models.Option.id, sort_by_parameter_order=True),
+            [
+                {"option_text": option_data.option_text, "question_id": question_model.id}
+                for option_data in question_data.options[shared:]
+            ],
+        )).scalars().all())
+
+    if len(current_options) > shared:
+        await db.execute(delete(models.Option).where(
+            models.Option.id.in_(row.id for row in current_options[shared:])
+        ))
+
+    question_model.correct_option_id = option_ids[correct_index]
+
+    await db.commit()
+
+    schedule_id = await db.scalar(
+        select(models.QuestionGroup.schedule_id).where(models.QuestionGroup.id == group_id)
+    )
+    await exam_cache.invalidate_exam_payload(schedule_id)
+    await exam_cache.invalidate_group_questions(group_id)
+    await exam_cache.invalidate_schedule_groups(schedule_id)
+
+    return schemas.QuestionStudentDisplay(
+        id=question_model.id,
+        group_id=question_model.group_id,
+        question_number=question_model.question_number,
+        question_text=question_model.question_text,
+        options=[
+            schemas.OptionStudentDisplay(id=option_id, option_text=option_data.option_text)
+            for option_id, option_data in zip(option_ids, question_data.options)
+        ],
+    )
 
 # Delete Question for a specific scheduled exam
 @admin_router.delete("/groups/{group_id}/questions/{question_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_question(group_id: int, question_id: int, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def delete_question(group_id: int, question_id: int, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """Deletes a question (and its options via cascade) after checking for attempts."""
-    
-    answer_count = db.query(models.UserAnswer).filter(models.UserAnswer.question_id == question_id).count()
-    
-    if answer_count > 0:
+
+    if await _exists(db, models.UserAnswer, models.UserAnswer.question_id == question_id):
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, 
+            status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete question. It has already been answered in recorded exams."
         )
 
-    question_model = db.query(models.Question).filter(models.Question.id == question_id, models.Question.group_id == group_id).first()
-    
-    if not question_model:
+    # Single DELETE .. RETURNING: the row-level FK cascades take out the
+    # options, and RETURNING doubles as the existence check.
+    deleted_id = (await db.execute(
+        delete(models.Question)
+        .where(models.Question.id == question_id, models.Question.group_id == group_id)
+        .returning(models.Question.id)
+    )).scalar_one_or_none()
+
+    if deleted_id is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question not found for this group.")
 
-    question_model.correct_option_id = None
-    db.flush() 
+    await db.commit()
+
+    schedule_id = await db.scalar(
+        select(models.QuestionGroup.schedule_id).where(models.QuestionGroup.id == group_id)
+    )
+    await exam_cache.invalidate_question_count(schedule_id)
+    await exam_cache.invalidate_exam_payload(schedule_id)
+    await exam_cache.invalidate_group_questions(group_id)
+    await exam_cache.invalidate_schedule_groups(schedule_id)
 
-    db.delete(question_model)
-    db.commit()
-    
     return
 
 
 # ============= QUESTION GROUP ============
 # Create Question Group
 @admin_router.post("/schedules/{schedule_id}/groups", response_model=schemas.QuestionGroupDisplay)
-async def create_question_group(schedule_id: int, group_data: schemas.QuestionGroup, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def create_question_group(schedule_id: int, group_data: schemas.QuestionGroup, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """
     Creates a new question group (section/instruction block) for a specific exam schedule.
     """
-    schedule_model = db.query(models.ExamSchedule).get(schedule_id)
-    if not schedule_model:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exam Schedule not found.")
-
-    existing_group = db.query(models.QuestionGroup).filter(
-        models.QuestionGroup.schedule_id == schedule_id,
-        models.QuestionGroup.display_order == group_data.display_order
-    ).first()
-    
-    if existing_group:
-         raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT, 
-            detail=f"Display order {group_data.display_order} already used in this schedule. Please choose a unique order number."
-        )
-
+    # The unique (schedule_id, display_order) index and the schedule FK
+    # enforce what the preflight SELECTs used to check, atomically.
     group_model = models.QuestionGroup(
         schedule_id=schedule_id,
         instruction_text=group_data.instruction_text,
@@ -930,81 +1324,121 @@ async def create_question_group(schedule_id: int, group_data: schemas.QuestionGr
         display_order=group_data.display_order
     )
     db.add(group_model)
-    db.commit()
-    db.refresh(group_model)
-    
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise _integrity_conflict(
+            exc,
+            f"Display order {group_data.display_order} already used in this schedule. Please choose a unique order number.",
+            "Exam Schedule not found."
+        )
+
+    await exam_cache.invalidate_exam_payload(schedule_id)
+    await exam_cache.invalidate_schedule_groups(schedule_id)
+
+    # A brand-new group has no questions; mark the collection loaded-and-
+    # empty instead of refreshing just to SELECT zero rows back.
+    set_committed_value(group_model, "questions", [])
+
     return group_model
 
 # Read All Groups for a Schedule
 @admin_router.get("/schedules/{schedule_id}/groups", response_model=List[schemas.QuestionGroupDisplay])
-async def read_question_groups(schedule_id: int, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def read_question_groups(schedule_id: int, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """
     Retrieves all question groups (sections) for a specific exam schedule, ordered by display_order.
     """
-    groups = db.query(models.QuestionGroup).filter(models.QuestionGroup.schedule_id == schedule_id).order_by(models.QuestionGroup.display_order).all()
-    
-    if not groups and not db.query(models.ExamSchedule).get(schedule_id):
+    cached = await exam_cache.get_schedule_groups(schedule_id)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    groups = (await db.scalars(
+        select(models.QuestionGroup).options(
+            *_guarded(selectinload(models.QuestionGroup.questions).selectinload(models.Question.options))
+        ).where(models.QuestionGroup.schedule_id == schedule_id).order_by(models.QuestionGroup.display_order)
+    )).all()
+
+    if not groups and not await _exists(db, models.ExamSchedule, models.ExamSchedule.id == schedule_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exam Schedule not found.")
-        
+
+    await exam_cache.set_schedule_groups(schedule_id, [
+        schemas.QuestionGroupDisplay.model_validate(group).model_dump()
+        for group in groups
+    ])
+
     return groups
 
 # Update Question Group
 @admin_router.put("/groups/{group_id}", response_model=schemas.QuestionGroupDisplay)
-async def update_question_group(group_id: int, group_data: schemas.QuestionGroup, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def update_question_group(group_id: int, group_data: schemas.QuestionGroup, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """
     Updates the details (instructions, title, order) of an existing question group.
     """
-    group_model = db.query(models.QuestionGroup).filter(models.QuestionGroup.id == group_id).first()
-    
+    group_model = (await db.scalars(
+        select(models.QuestionGroup).options(
+            selectinload(models.QuestionGroup.questions).selectinload(models.Question.options)
+        ).where(models.QuestionGroup.id == group_id)
+    )).first()
+
     if not group_model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question Group not found.")
 
-    if group_model.display_order != group_data.display_order:
-        existing_group_with_order = db.query(models.QuestionGroup).filter(
-            models.QuestionGroup.schedule_id == group_model.schedule_id,
-            models.QuestionGroup.display_order == group_data.display_order,
-            models.QuestionGroup.id != group_id
-        ).first()
-        
-        if existing_group_with_order:
-             raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT, 
-                detail=f"Display order {group_data.display_order} is already used by another group in this schedule."
-            )
-    
     group_model.instruction_text = group_data.instruction_text
     group_model.group_title = group_data.group_title
     group_model.display_order = group_data.display_order
-    
-    db.commit()
-    db.refresh(group_model)
-    
+
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        raise _integrity_conflict(
+            exc,
+            f"Display order {group_data.display_order} is already used by another group in this schedule."
+        )
+
+    await exam_cache.invalidate_exam_payload(group_model.schedule_id)
+    await exam_cache.invalidate_schedule_groups(group_model.schedule_id)
+
     return group_model
 
 # Delete Question Group
 @admin_router.delete("/groups/{group_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_question_group(group_id: int, admin_user: dict = Depends(get_current_admin_user), db: Session = Depends(get_db)):
+async def delete_question_group(group_id: int, admin_user: dict = Depends(get_current_admin_user), db: AsyncSession = Depends(get_db)):
     """
     Deletes a question group and cascades the deletion to all associated questions and options.
     """
-    group_model = db.query(models.QuestionGroup).filter(models.QuestionGroup.id == group_id).first()
-    
-    if not group_model:
+    # One round-trip resolves the group (schedule_id for cache
+    # invalidation) and a correlated EXISTS over its answers, instead of
+    # loading every question just to collect ids for an IN probe.
+    row = (await db.execute(
+        select(
+            models.QuestionGroup.schedule_id,
+            select(literal(True)).select_from(models.UserAnswer).join(
+                models.Question, models.UserAnswer.question_id == models.Question.id
+            ).where(models.Question.group_id == models.QuestionGroup.id).exists(),
+        ).where(models.QuestionGroup.id == group_id)
+    )).first()
+
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Question Group not found.")
 
-    question_ids = [q.id for q in group_model.questions]
-    
-    if question_ids:
-        answer_count = db.query(models.UserAnswer).filter(models.UserAnswer.question_id.in_(question_ids)).count()
-        
-        if answer_count > 0:
-             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, 
-                detail=f"Cannot delete group. {answer_count} answers are recorded against questions in this group. Delete the schedule first or archive this group."
-            )
-            
-    db.delete(group_model)
-    db.commit()
-    
-    return
+    schedule_id, has_answers = row
+
+    if has_answers:
+         raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot delete group. Answers are recorded against questions in this group. Delete the schedule first or archive this group."
+        )
+
+    # Core DELETE so the database cascades group -> questions -> options in
+    # one statement, instead of the ORM loading and deleting row by row.
+    await db.execute(delete(models.QuestionGroup).where(models.QuestionGroup.id == group_id))
+    await db.commit()
 
+    await exam_cache.invalidate_question_count(schedule_id)
+    await exam_cache.invalidate_exam_payload(schedule_id)
+    await exam_cache.invalidate_group_questions(group_id)
+    await exam_cache.invalidate_schedule_groups(schedule_id)
+
+    return
@@ -1,5 +1,5 @@
 from datetime import datetime, date, time
-from pydantic import BaseModel, computed_field, model_validator
+from pydantic import BaseModel, ConfigDict, computed_field
 from typing import List, Optional
 
 # Option
@@ -12,8 +12,7 @@ class OptionStudentDisplay(BaseModel):
     id: int
     option_text: str
     
-    class ConfigDict:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Question
 class Question(BaseModel):
@@ -29,8 +28,7 @@ class QuestionStudentDisplay(BaseModel):
     question_text: str
     options: List[OptionStudentDisplay]
     
-    class ConfigDict:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class QuestionGroup(BaseModel):
@@ -44,15 +42,13 @@ class QuestionGroupDisplay(QuestionGroup):
     schedule_id: int
     questions: List[QuestionStudentDisplay] = [] 
     
-    class ConfigDict:
-        from_attributes = True    
+    model_config = ConfigDict(from_attributes=True)
     
 class QuestionGroupStudentDisplay(QuestionGroup):
     id: int
     questions: List['QuestionStudentDisplay'] = []
     
-    class ConfigDict:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Subject
 class Subject(BaseModel):
@@ -62,14 +58,8 @@ class Subject(BaseModel):
 class SubjectDisplay(BaseModel):
     id: int
     name: str
-    
-    @computed_field
-    @property
-    def question_count(self) -> int:
-        if hasattr(self, 'questions') and self.questions is not None:
-             return len(self.questions)
-        return 0 
- 
+    question_count: int = 0
+
     class Config:
         from_attributes = True
 
@@ -99,22 +89,10 @@ class StudentDisplay(BaseModel):
     reg_number: str
     class_id: int
     student_class: Optional['ClassDisplay'] = None
+    # Populated by the handlers from the joined Class.name column; no
+    # per-object validator reaching into relationships.
     class_name: Optional[str] = None
-    
-    
-    @model_validator(mode='before')
-    @classmethod
-    def extract_student_relations(cls, data):
-        # Handle cases where data is an ORM object or a dict
-        student_class = getattr(data, 'student_class', None)
-        if student_class:
-            # Manually inject class_name for convenience
-            if isinstance(data, dict):
-                data['class_name'] = student_class.name
-            else:
-                setattr(data, 'class_name', student_class.name)
-        return data
-    
+
     class Config:
         from_attributes = True
 
@@ -176,8 +154,7 @@ class ExamScheduleDashboard(BaseModel):
     number_of_groups: int = 0
     total_questions: int = 0
     
-    class ConfigDict:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Auth
 class ExamLoginInput(BaseModel):
@@ -202,8 +179,7 @@ class ExamStartResponse(BaseModel):
     question_groups: List[QuestionGroupStudentDisplay]
     total_questions: int
     
-    class ConfigDict:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
    
 # Answers and Report
 class AnswerInput(BaseModel):